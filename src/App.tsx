@@ -24,7 +24,7 @@ export default function App() {
   // Coming back to the window is the natural moment Anki may have been opened
   // (or closed) — re-probe so the status dot never goes stale.
   useEffect(() => {
-    const onFocus = () => void useLectern.getState().refreshAnki()
+    const onFocus = () => void useLectern.getState().refreshAnkiOnFocus()
     window.addEventListener('focus', onFocus)
     return () => window.removeEventListener('focus', onFocus)
   }, [])
@@ -3,11 +3,13 @@ import { describe, expect, it, vi } from 'vitest'
 import {
   AnkiApiError,
   AnkiClient,
+  AnkiTimeoutError,
   AnkiTransportError,
   cardToNote,
   checkConnection,
   previewSync,
   resolveModelNames,
+  SYNC_BATCH_SIZE,
   syncCards,
 } from './anki'
 import type { Card, Settings, SyncProgress } from './types'
@@ -44,11 +46,28 @@ interface MockFetch {
 function makeFetch(handler: MockHandler): MockFetch {
   const calls: Envelope[] = []
   const requests: { url: string; method?: string }[] = []
+  // `multi` bundles envelopes: each inner action is recorded and routed like a
+  // top-level call, and its reply wrapped the way AnkiConnect wraps it. A
+  // transport failure on any inner action fails the whole request.
+  const runMulti = (envelope: Envelope): MockReply => {
+    const results: unknown[] = []
+    for (const inner of (envelope.params?.actions ?? []) as Envelope[]) {
+      calls.push(inner)
+      const reply = handler(inner.action, inner.params, calls.length - 1)
+      if ('result' in reply) results.push({ result: reply.result, error: null })
+      else if ('apiError' in reply) results.push({ result: null, error: reply.apiError })
+      else return reply
+    }
+    return { result: results }
+  }
   const fetchFn: typeof fetch = async (input, init) => {
     requests.push({ url: String(input), method: init?.method })
     const envelope = JSON.parse(String(init?.body)) as Envelope
     calls.push(envelope)
-    const reply = handler(envelope.action, envelope.params, calls.length - 1)
+    const reply =
+      envelope.action === 'multi'
+        ? runMulti(envelope)
+        : handler(envelope.action, envelope.params, calls.length - 1)
     if ('networkError' in reply) throw new TypeError(reply.networkError)
     if ('httpStatus' in reply) return new Response('boom', { status: reply.httpStatus })
     if ('rawBody' in reply) return new Response(reply.rawBody, { status: 200 })
@@ -223,6 +242,42 @@ describe('AnkiClient errors and retry', () => {
     await expect(client.deckNames()).rejects.toBeInstanceOf(AnkiTransportError)
   })
 
+  it('does not re-send a timed-out batch that adds notes', async () => {
+    // A fetch that only ends when the client gives up on it.
+    const hang = (): { fetchFn: typeof fetch; sent: string[] } => {
+      const sent: string[] = []
+      const fetchFn: typeof fetch = (_input, init) => {
+        sent.push(String(init?.body))
+        return new Promise((_resolve, reject) => {
+          init?.signal?.addEventListener('abort', () => reject(new Error('aborted')))
+        })
+      }
+      return { fetchFn, sent }
+    }
+    vi.useFakeTimers()
+    try {
+      // Anki may still be applying it: a re-send would make every note a duplicate.
+      const adds = hang()
+      const addBatch = makeClient(adds.fetchFn)
+        .multi([{ action: 'addNote', params: { note: {} } }])
+        .catch((e: unknown) => e)
+      await vi.runAllTimersAsync()
+      expect(await addBatch).toBeInstanceOf(AnkiTimeoutError)
+      expect(adds.sent).toHaveLength(1)
+
+      // Updates are safe to repeat, so their batches keep the usual retries.
+      const updates = hang()
+      const updateBatch = makeClient(updates.fetchFn)
+        .multi([{ action: 'updateNote', params: { note: { id: 1 } } }])
+        .catch((e: unknown) => e)
+      await vi.runAllTimersAsync()
+      expect(await updateBatch).toBeInstanceOf(AnkiTimeoutError)
+      expect(updates.sent).toHaveLength(4)
+    } finally {
+      vi.useRealTimers()
+    }
+  })
+
   it('version() is a single probe — no retry on transport failure', async () => {
     const { fetchFn, calls } = makeFetch(() => ({ networkError: 'refused' }))
     const client = makeClient(fetchFn)
@@ -557,7 +612,7 @@ describe('previewSync', () => {
 // --- syncCards ------------------------------------------------------------------
 
 describe('syncCards', () => {
-  it('creates/updates per card, collects failures without aborting, reports progress', async () => {
+  it('creates and updates in one batch, skips duplicates, reports progress per batch', async () => {
     const cards: Card[] = [
       makeCard({ uid: 'u1', fields: { Front: 'Q1', Back: 'A1' } }),
       makeCard({ uid: 'u2', fields: { Front: 'Q2 dup', Back: 'A2' } }),
@@ -597,12 +652,8 @@ describe('syncCards', () => {
       ]),
     )
 
-    // Progress after every card, including the skipped one.
-    expect(onProgress.mock.calls.map(([p]) => p)).toEqual([
-      { done: 1, total: 3 },
-      { done: 2, total: 3 },
-      { done: 3, total: 3 },
-    ])
+    // Progress after every batch, counting the skipped card too.
+    expect(onProgress.mock.calls.map(([p]) => p)).toEqual([{ done: 3, total: 3 }])
 
     // Deck is created before any note operation.
     const actionOrder = calls.map((c) => c.action)
@@ -699,34 +750,134 @@ describe('syncCards', () => {
     expect(result.noteIds.get('card-1')).toBe(9001)
   })
 
-  it('collects transport failures per card after retries are exhausted', async () => {
-    const { fetchFn } = makeFetch(
+  it('sends adds in batches of SYNC_BATCH_SIZE, one multi request each', async () => {
+    const cards = Array.from({ length: SYNC_BATCH_SIZE + 5 }, (_, i) =>
+      makeCard({ uid: `u${i}`, fields: { Front: `Q${i}`, Back: `A${i}` } }),
+    )
+    const { fetchFn, calls } = makeFetch(
       routes({
         modelNames: () => ({ result: ['Basic', 'Cloze'] }),
         createDeck: () => ({ result: 42 }),
+        canAddNotes: () => ({ result: cards.map(() => true) }),
         addNote: (_params, nth) =>
-          nth < 4 ? { networkError: 'connection dropped' } : { result: 1502 },
+          nth === 3 ? { apiError: 'cannot create note: field is empty' } : { result: 2000 + nth },
       }),
     )
     const progress: SyncProgress[] = []
 
     const result = await syncCards(
       makeClient(fetchFn),
-      [makeCard({ uid: 'u1' }), makeCard({ uid: 'u2', fields: { Front: 'Q2', Back: 'A2' } })],
+      cards,
       'Deck',
       makeSettings(),
       tagsFor,
       (p) => progress.push(p),
     )
 
-    // Card 1 burns all 4 attempts and fails; card 2 succeeds.
-    expect(result.created).toBe(1)
-    expect(result.failures).toHaveLength(1)
-    expect(result.failures[0].uid).toBe('u1')
-    expect(result.failures[0].error).toContain('Failed to reach AnkiConnect')
+    expect(calls.filter((c) => c.action === 'multi')).toHaveLength(2)
+    expect(calls.filter((c) => c.action === 'addNote')).toHaveLength(cards.length)
+    // Inner actions carry their own version, or AnkiConnect answers in the
+    // old shape where an error is indistinguishable from a result.
+    expect(calls.find((c) => c.action === 'addNote')?.version).toBe(6)
+
+    // One refused note fails alone; its neighbours in the batch land.
+    expect(result.created).toBe(cards.length - 1)
+    expect(result.failures).toEqual([
+      {
+        uid: 'u3',
+        front: 'Q3',
+        error: 'AnkiConnect error for addNote: cannot create note: field is empty',
+      },
+    ])
+    expect(result.noteIds.get('u0')).toBe(2000)
+    expect(result.noteIds.get('u4')).toBe(2004)
     expect(progress).toEqual([
-      { done: 1, total: 2 },
-      { done: 2, total: 2 },
+      { done: SYNC_BATCH_SIZE, total: cards.length },
+      { done: cards.length, total: cards.length },
     ])
   })
+
+  it('sends updates in the same multi request as adds', async () => {
+    const cards: Card[] = [
+      makeCard({ uid: 'u1', ankiNoteId: 701, fields: { Front: 'Q1', Back: 'A1' } }),
+      makeCard({ uid: 'u2', fields: { Front: 'Q2', Back: 'A2' } }),
+      makeCard({ uid: 'u3', ankiNoteId: 703, fields: { Front: 'Q3', Back: 'A3' } }),
+    ]
+    const { fetchFn, calls } = makeFetch(
+      routes({
+        modelNames: () => ({ result: ['Basic', 'Cloze'] }),
+        createDeck: () => ({ result: 42 }),
+        canAddNotes: () => ({ result: [true] }),
+        addNote: () => ({ result: 1502 }),
+        // The third card's note was deleted in Anki since the last sync.
+        updateNote: (params) =>
+          (params?.note as { id: number }).id === 703
+            ? { apiError: 'note was not found: 703' }
+            : { result: null },
+      }),
+    )
+
+    const result = await syncCards(
+      makeClient(fetchFn),
+      cards,
+      'Deck',
+      makeSettings(),
+      tagsFor,
+      () => {},
+    )
+
+    const multi = calls.filter((c) => c.action === 'multi')
+    expect(multi).toHaveLength(1)
+    expect((multi[0].params?.actions as Envelope[]).map((a) => a.action)).toEqual([
+      'updateNote',
+      'addNote',
+      'updateNote',
+    ])
+    expect(result.updated).toBe(1)
+    expect(result.created).toBe(1)
+    expect(result.failures).toEqual([
+      {
+        uid: 'u3',
+        front: 'Q3',
+        error: 'AnkiConnect error for updateNote: note was not found: 703',
+      },
+    ])
+    expect(result.noteIds).toEqual(
+      new Map([
+        ['u1', 701],
+        ['u2', 1502],
+      ]),
+    )
+  })
+
+  it('reports a batch lost to transport failure per card and carries on', async () => {
+    const cards = Array.from({ length: SYNC_BATCH_SIZE + 1 }, (_, i) =>
+      makeCard({ uid: `u${i}`, fields: { Front: `Q${i}`, Back: `A${i}` } }),
+    )
+    const { fetchFn } = makeFetch(
+      routes({
+        modelNames: () => ({ result: ['Basic', 'Cloze'] }),
+        createDeck: () => ({ result: 42 }),
+        canAddNotes: () => ({ result: cards.map(() => true) }),
+        // The first batch's request dies on all 4 attempts; the second lands.
+        addNote: (_params, nth) =>
+          nth < 4 ? { networkError: 'connection dropped' } : { result: 1502 },
+      }),
+    )
+
+    const result = await syncCards(
+      makeClient(fetchFn),
+      cards,
+      'Deck',
+      makeSettings(),
+      tagsFor,
+      () => {},
+    )
+
+    expect(result.created).toBe(1)
+    expect(result.noteIds.get(`u${SYNC_BATCH_SIZE}`)).toBe(1502)
+    expect(result.failures).toHaveLength(SYNC_BATCH_SIZE)
+    expect(result.failures[0].uid).toBe('u0')
+    expect(result.failures[0].error).toContain('Failed to reach AnkiConnect')
+  })
 })
@@ -10,7 +10,9 @@
  *   never referenced directly.
  * - Transport failures (network, timeout, HTTP status, non-JSON body) raise
  *   `AnkiTransportError` and are retried with exponential backoff
- *   (0.5s → 4s cap, 3 retries). API-level errors ({error: ...} in the
+ *   (0.5s → 4s cap, 3 retries). A timed-out request that adds notes is the
+ *   exception: Anki may still be applying it, and a re-send would turn every
+ *   note in it into a duplicate. API-level errors ({error: ...} in the
  *   envelope) raise `AnkiApiError` and fail fast.
  */
 
@@ -35,6 +37,10 @@ export const MAX_RETRY_DELAY_MS = 4000
 export const HEALTH_TIMEOUT_MS = 5000
 /** Timeout for regular collection operations. */
 export const OP_TIMEOUT_MS = 15_000
+/** Extra timeout per action in a `multi` request; they run one by one. */
+export const MULTI_ACTION_TIMEOUT_MS = 1000
+/** Notes sent per `multi` request during a sync. */
+export const SYNC_BATCH_SIZE = 25
 
 // --- Errors ------------------------------------------------------------------
 
@@ -55,6 +61,10 @@ export class AnkiTransportError extends AnkiConnectError {
   }
 }
 
+/** The request went out but no answer came back in time. Anki may still be
+ *  working through it, so it is only retried when re-running it is harmless. */
+export class AnkiTimeoutError extends AnkiTransportError {}
+
 /** Error returned by the AnkiConnect API itself. Not retriable. */
 export class AnkiApiError extends AnkiConnectError {
   constructor(message: string) {
@@ -82,10 +92,16 @@ export interface AnkiNoteInfo {
   [key: string]: unknown
 }
 
+/** One action's outcome inside a `multi` request: its result, or the error text. */
+export type MultiOutcome = { result: unknown; error: null } | { result: null; error: string }
+
 interface InvokeOptions {
   timeoutMs?: number
   /** Set false for single-probe calls (health checks). Defaults to true. */
   retry?: boolean
+  /** Set false when running the request twice would do the work twice
+   *  (adding notes); a timeout is then not retried. Defaults to true. */
+  idempotent?: boolean
 }
 
 /** Test seam: retry pacing can be tightened without touching semantics. */
@@ -149,9 +165,10 @@ export class AnkiClient {
         signal: controller.signal,
       })
     } catch (err) {
-      throw new AnkiTransportError(
-        `Failed to reach AnkiConnect at ${this.baseUrl}: ${errorMessage(err)}`,
-      )
+      const message = `Failed to reach AnkiConnect at ${this.baseUrl}: ${errorMessage(err)}`
+      throw controller.signal.aborted
+        ? new AnkiTimeoutError(message)
+        : new AnkiTransportError(message)
     } finally {
       clearTimeout(timer)
     }
@@ -187,13 +204,16 @@ export class AnkiClient {
   ): Promise<unknown> {
     const timeoutMs = options.timeoutMs ?? OP_TIMEOUT_MS
     const maxRetries = (options.retry ?? true) ? this.maxRetries : 0
+    const idempotent = options.idempotent ?? true
     let delay = this.initialRetryDelayMs
 
     for (let attempt = 0; ; attempt++) {
       try {
         return await this.invokeOnce(action, params, timeoutMs)
       } catch (err) {
-        if (err instanceof AnkiTransportError && attempt < maxRetries) {
+        const retriable =
+          err instanceof AnkiTransportError && (idempotent || !(err instanceof AnkiTimeoutError))
+        if (retriable && attempt < maxRetries) {
           await sleep(delay)
           delay = Math.min(delay * 2, this.maxRetryDelayMs)
           continue
@@ -237,13 +257,53 @@ export class AnkiClient {
   }
 
   async addNote(note: AnkiNote): Promise<number> {
-    const result = await this.invoke('addNote', { note })
+    const result = await this.invoke('addNote', { note }, { idempotent: false })
     if (typeof result !== 'number') {
       throw new AnkiApiError(`Unexpected addNote result: ${String(result)}`)
     }
     return result
   }
 
+  /**
+   * Several actions in one request. AnkiConnect runs each on its own — one
+   * refused note does not fail its neighbours — so outcomes come back per
+   * action, in order. Transport failures still fail (and retry) the request
+   * as a whole — except a timed-out batch that adds notes, see the header.
+   */
+  async multi(actions: Array<{ action: string; params?: unknown }>): Promise<MultiOutcome[]> {
+    if (actions.length === 0) return []
+    const result = await this.invoke(
+      'multi',
+      {
+        // Each inner action names its version too; without it AnkiConnect
+        // answers in the pre-v6 shape, with no way to tell errors from results.
+        actions: actions.map(({ action, params }) =>
+          params === undefined ? { action, version: 6 } : { action, version: 6, params },
+        ),
+      },
+      {
+        // The actions queue on Anki's main thread one after another; a full
+        // batch can outlast the single-operation timeout while still landing.
+        timeoutMs: OP_TIMEOUT_MS + actions.length * MULTI_ACTION_TIMEOUT_MS,
+        idempotent: !actions.some(({ action }) => action === 'addNote'),
+      },
+    )
+    if (!Array.isArray(result) || result.length !== actions.length) {
+      throw new AnkiApiError(`Unexpected multi result: ${String(result)}`)
+    }
+    return result.map((reply, i): MultiOutcome => {
+      const { action } = actions[i]
+      if (!isRecord(reply)) {
+        return { result: null, error: `Unexpected ${action} reply: ${String(reply)}` }
+      }
+      if (reply.error === null || reply.error === undefined) {
+        return { result: reply.result, error: null }
+      }
+      const detail = typeof reply.error === 'string' ? reply.error : JSON.stringify(reply.error)
+      return { result: null, error: `AnkiConnect error for ${action}: ${detail}` }
+    })
+  }
+
   async updateNoteFields(id: number, fields: Record<string, string>): Promise<void> {
     await this.invoke('updateNoteFields', { note: { id, fields } })
   }
@@ -621,15 +681,15 @@ export async function previewSync(
 
   let duplicates = 0
   if (creates.length > 0) {
-    const resolved = await resolveModelNames(client, settings)
+    // Independent lookups, so they share the wait. A failed deck listing
+    // keeps the requested deck; canAddNotes will surface real transport errors.
+    const [resolved, decks] = await Promise.all([
+      resolveModelNames(client, settings),
+      client.deckNames().catch(() => null),
+    ])
 
     let probeDeck = deckName
-    try {
-      const decks = await client.deckNames()
-      if (!decks.includes(deckName) && decks.length > 0) probeDeck = decks[0]
-    } catch {
-      // keep the requested deck; canAddNotes will surface real transport errors
-    }
+    if (decks && !decks.includes(deckName) && decks.length > 0) probeDeck = decks[0]
 
     const notes = creates.map((card) => {
       const modelName = modelNameFor(card, resolved)
@@ -651,10 +711,12 @@ export async function previewSync(
 
 /**
  * Execute a sync (semantics of `stream_sync_cards`): ensure the deck exists,
- * then per card either update (has `ankiNoteId`) or add. One card's failure
- * never aborts the batch — it is collected as a SyncFailure — and progress is
- * reported after every card, success or not. Returns the counts plus a map of
- * card uid → Anki note id for successfully synced cards.
+ * then per card either update (has `ankiNoteId`) or add. Both go out in
+ * batches of SYNC_BATCH_SIZE, one `multi` request each, rather than one
+ * round-trip per card. One card's failure never aborts the sync — it is
+ * collected as a SyncFailure — and progress is reported after every batch.
+ * Returns the counts plus a map of card uid → Anki note id for successfully
+ * synced cards.
  */
 export async function syncCards(
   client: AnkiClient,
@@ -708,29 +770,61 @@ export async function syncCards(
   const noteIds = new Map<string, number>()
   const total = cards.length
 
-  for (let i = 0; i < cards.length; i++) {
-    const card = cards[i]
-    try {
-      if (duplicateUids.has(card.uid)) {
-        duplicates.push({ uid: card.uid, front: cardFrontText(card) })
-      } else if (typeof card.ankiNoteId === 'number') {
-        const note = buildNote(card)
-        await client.updateNote({ id: card.ankiNoteId, fields: note.fields, tags: note.tags })
-        updated++
-        noteIds.set(card.uid, card.ankiNoteId)
-      } else {
-        const id = await client.addNote(buildNote(card))
-        created++
-        noteIds.set(card.uid, id)
+  const fail = (card: Card, error: string): void => {
+    failures.push({ uid: card.uid, front: cardFrontText(card), error })
+  }
+
+  for (let start = 0; start < total; start += SYNC_BATCH_SIZE) {
+    const batch = cards.slice(start, start + SYNC_BATCH_SIZE)
+    // Updates ride in the same request as the adds: a re-sync of an edited
+    // deck is mostly updates, and each used to be its own round-trip.
+    const ops: Array<{ card: Card; noteId: number | null; action: string; params: unknown }> = []
+    for (const card of batch) {
+      try {
+        if (duplicateUids.has(card.uid)) {
+          duplicates.push({ uid: card.uid, front: cardFrontText(card) })
+        } else if (typeof card.ankiNoteId === 'number') {
+          const { fields, tags } = buildNote(card)
+          const id = card.ankiNoteId
+          ops.push({
+            card,
+            noteId: id,
+            action: 'updateNote',
+            params: { note: { id, fields, tags } },
+          })
+        } else {
+          ops.push({ card, noteId: null, action: 'addNote', params: { note: buildNote(card) } })
+        }
+      } catch (err) {
+        fail(card, errorMessage(err))
       }
-    } catch (err) {
-      failures.push({
-        uid: card.uid,
-        front: cardFrontText(card),
-        error: errorMessage(err),
-      })
     }
-    onProgress({ done: i + 1, total })
+
+    if (ops.length > 0) {
+      try {
+        const outcomes = await client.multi(ops.map(({ action, params }) => ({ action, params })))
+        ops.forEach(({ card, noteId }, i) => {
+          const outcome = outcomes[i]
+          if (outcome.error !== null) {
+            fail(card, outcome.error)
+          } else if (noteId !== null) {
+            updated++
+            noteIds.set(card.uid, noteId)
+          } else if (typeof outcome.result !== 'number') {
+            fail(card, `Unexpected addNote result: ${String(outcome.result)}`)
+          } else {
+            created++
+            noteIds.set(card.uid, outcome.result)
+          }
+        })
+      } catch (err) {
+        // The request itself failed (after any retries): no card in it is
+        // known to have landed, so every card in it is reported.
+        for (const { card } of ops) fail(card, errorMessage(err))
+      }
+    }
+
+    onProgress({ done: start + batch.length, total })
   }
 
   return { created, updated, duplicates, failures, noteIds }
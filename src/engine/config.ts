@@ -12,6 +12,8 @@ export const CARDS_PER_SLIDE_TARGET = 0.6
 export const SCRIPT_BASE_CHARS = 1000
 /** Weight of embedded images when sizing script-mode decks. */
 export const IMAGE_CARD_WEIGHT = 0.5
+/** Most pages whose images are counted; longer documents are sampled evenly. */
+export const IMAGE_SCAN_PAGE_LIMIT = 100
 /** Documents above this chars/page are treated as script, below as slides. */
 export const DENSE_THRESHOLD_CHARS_PER_PAGE = 1500
 
@@ -28,7 +28,19 @@ export function estimateCost(pdfInfo: PdfInfo, sizing: SizingPlan, model: string
   const outputTokens = Math.round(
     sizing.totalCardCap * ESTIMATION_TOKENS_PER_CARD * (1 + ESTIMATION_BASE_OUTPUT_RATIO) * 2,
   )
-  const [inPrice, outPrice] = GEMINI_PRICING[model] ?? GEMINI_PRICING.default
-  const costUsd = (inputTokens * inPrice + outputTokens * outPrice) / 1_000_000
-  return { inputTokens, outputTokens, costUsd }
+  return { inputTokens, outputTokens, costUsd: tokenCostUsd(model, inputTokens, outputTokens) }
+}
+
+/**
+ * USD for a token count at the model's list price. The one place a model id
+ * resolves to a price: the estimate and both agent loops' recorded usage used
+ * to repeat the lookup, and an unknown or retired id falls back to `default`
+ * the same way everywhere. Own-property lookup, so an id can never resolve to
+ * something off Object.prototype.
+ */
+export function tokenCostUsd(model: string, inputTokens: number, outputTokens: number): number {
+  const [inPrice, outPrice] = Object.hasOwn(GEMINI_PRICING, model)
+    ? GEMINI_PRICING[model]
+    : GEMINI_PRICING.default
+  return (inputTokens * inPrice + outputTokens * outPrice) / 1_000_000
 }
@@ -16,11 +16,11 @@
 
 import {
   FOLLOWUP_CARD_CAP,
-  GEMINI_PRICING,
   MAX_FOLLOWUP_ROUNDS,
   NON_PROGRESS_MAX_ROUNDS,
   THINKING_BY_PHASE,
 } from './config'
+import { tokenCostUsd } from './cost'
 import { buildCoverageCatalog, buildGenerationGapText, computeCoverageData } from './coverage'
 import { GeminiClient, type GeminiUsage, type InputPart } from './gemini'
 import { FINISH_REQUEST_TOOL, FOLLOWUP_ADD_CARDS_TOOL, parseSubmitCardsArgs } from './geminiSchemas'
@@ -236,8 +236,7 @@ export async function runFollowUp(opts: FollowUpOptions): Promise<FollowUpOutcom
     track(response.usage)
   }
 
-  const [inPrice, outPrice] = GEMINI_PRICING[opts.model] ?? GEMINI_PRICING.default
-  const costUsd = (usage.inputTokens * inPrice + usage.outputTokens * outPrice) / 1_000_000
+  const costUsd = tokenCostUsd(opts.model, usage.inputTokens, usage.outputTokens)
 
   return {
     added,
@@ -67,17 +67,27 @@ export async function ensureLecternModels(
 
   /** Restyle only, or restyle and rewrite the templates with it. */
   const toUpdate: Array<{ def: (typeof LECTERN_NOTE_TYPES)[number]; templates: boolean }> = []
-  for (const def of toInspect) {
-    // Name is not identity: another add-on's "Lectern Basic" would take the
-    // sync and quietly drop Topic/Source/Excerpt, since AnkiConnect ignores
-    // field names a model does not have.
-    const fields = new Set(await client.modelFieldNames(def.name).catch(() => def.fields))
-    if (def.fields.some((name) => !fields.has(name))) {
+  // The note types are inspected concurrently: Anki answering for Basic does
+  // not depend on Cloze. Within one note type the two round-trips stay in
+  // order — the styling is only worth reading once the fields match. Results
+  // are folded in definition order so the report stays deterministic.
+  const inspections = await Promise.all(
+    toInspect.map(async (def) => {
+      // Name is not identity: another add-on's "Lectern Basic" would take the
+      // sync and quietly drop Topic/Source/Excerpt, since AnkiConnect ignores
+      // field names a model does not have.
+      const fields = new Set(await client.modelFieldNames(def.name).catch(() => def.fields))
+      if (def.fields.some((name) => !fields.has(name))) {
+        return { def, fieldMismatch: true, marker: null }
+      }
+      const marker = parseStyleMarker(await client.modelStyling(def.name))
+      return { def, fieldMismatch: false, marker }
+    }),
+  )
+  for (const { def, fieldMismatch, marker } of inspections) {
+    if (fieldMismatch) {
       result.fieldMismatch.push(def.name)
-      continue
-    }
-    const marker = parseStyleMarker(await client.modelStyling(def.name))
-    if (!marker) {
+    } else if (!marker) {
       result.userOwned.push(def.name)
     } else if (marker.version > NOTE_TYPE_VERSION) {
       // Installed by a newer Lectern (a second machine): downgrades never
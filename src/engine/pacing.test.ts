@@ -1,7 +1,16 @@
 import { describe, expect, it } from 'vitest'
 
-import { DYNAMIC_MAX_NOTES_PER_BATCH, DYNAMIC_MIN_NOTES_PER_BATCH } from './config'
-import { computeSizingPlan, detectContentMode } from './pacing'
+import {
+  DYNAMIC_MAX_NOTES_PER_BATCH,
+  DYNAMIC_MIN_NOTES_PER_BATCH,
+  IMAGE_SCAN_PAGE_LIMIT,
+} from './config'
+import {
+  computeSizingPlan,
+  detectContentMode,
+  extrapolateImageCount,
+  imageScanStride,
+} from './pacing'
 import type { PdfInfo } from './types'
 
 const pdf = (pageCount: number, textChars: number, imageCount = 0): PdfInfo => ({
@@ -83,3 +92,40 @@ describe('computeSizingPlan', () => {
     })
   })
 })
+
+// ---------------------------------------------------------------------------
+// image sampling
+// ---------------------------------------------------------------------------
+
+describe('image sampling', () => {
+  it('counts every page up to the limit', () => {
+    expect(imageScanStride(1)).toBe(1)
+    expect(imageScanStride(IMAGE_SCAN_PAGE_LIMIT)).toBe(1)
+    expect(extrapolateImageCount(37, IMAGE_SCAN_PAGE_LIMIT, IMAGE_SCAN_PAGE_LIMIT)).toBe(37)
+  })
+
+  it('spreads the sample across the whole document', () => {
+    for (const pageCount of [101, 250, 301, 1000, 1234]) {
+      const stride = imageScanStride(pageCount)
+      const scanned = Array.from({ length: pageCount }, (_, i) => i + 1).filter(
+        (page) => (page - 1) % stride === 0,
+      )
+      expect(scanned.length).toBeLessThanOrEqual(IMAGE_SCAN_PAGE_LIMIT)
+      // The last stretch is sampled too, not just the opening pages.
+      expect(scanned[scanned.length - 1]).toBeGreaterThan(pageCount - stride)
+    }
+  })
+
+  it('scales the sampled count to the page count', () => {
+    expect(extrapolateImageCount(40, 100, 1000)).toBe(400)
+    expect(extrapolateImageCount(5, 84, 250)).toBe(15) // round(5 * 250 / 84)
+    expect(extrapolateImageCount(0, 0, 0)).toBe(0)
+  })
+
+  it('feeds an extrapolated count into the script-mode cap', () => {
+    const imageCount = extrapolateImageCount(40, 100, 1000)
+    const plan = computeSizingPlan(pdf(1000, 1_500_000, imageCount)) // 1500 chars/page
+    expect(plan.contentMode).toBe('script')
+    expect(plan.totalCardCap).toBe(1700) // round(1_500_000/1000 + 400*0.5)
+  })
+})
@@ -12,6 +12,7 @@ import {
   DYNAMIC_MAX_NOTES_PER_BATCH,
   DYNAMIC_MIN_NOTES_PER_BATCH,
   IMAGE_CARD_WEIGHT,
+  IMAGE_SCAN_PAGE_LIMIT,
   MIN_TOTAL_CARDS,
   SCRIPT_BASE_CHARS,
 } from './config'
@@ -22,6 +23,27 @@ export function detectContentMode(pdfInfo: PdfInfo): ContentMode {
   return charsPerPage >= DENSE_THRESHOLD_CHARS_PER_PAGE ? 'script' : 'slides'
 }
 
+/**
+ * Every how many pages the image count looks at a page. Counting a page's
+ * images means building its operator list, the expensive half of the
+ * metadata pass, so documents past IMAGE_SCAN_PAGE_LIMIT are sampled — spread
+ * across the whole document, so a figure-heavy opening or an image-free
+ * appendix doesn't stand in for the rest.
+ */
+export function imageScanStride(pageCount: number): number {
+  return Math.max(1, Math.ceil(pageCount / IMAGE_SCAN_PAGE_LIMIT))
+}
+
+/** Scale the images found on the sampled pages up to the whole document. */
+export function extrapolateImageCount(
+  counted: number,
+  scannedPages: number,
+  pageCount: number,
+): number {
+  if (scannedPages === 0 || scannedPages >= pageCount) return counted
+  return Math.round((counted * pageCount) / scannedPages)
+}
+
 export interface SizingOptions {
   /** Explicit user override for the total card cap. */
   userTargetCards?: number
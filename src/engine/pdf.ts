@@ -8,6 +8,7 @@ import './streamPolyfill'
 import './webkitPolyfills'
 import * as pdfjs from 'pdfjs-dist'
 import type { PDFDocumentProxy } from 'pdfjs-dist'
+import { extrapolateImageCount, imageScanStride } from './pacing'
 import type { PdfInfo } from './types'
 
 // Custom worker entry (instead of workerSrc pointing at the stock build) so
@@ -16,9 +17,6 @@ pdfjs.GlobalWorkerOptions.workerPort = new Worker(new URL('./pdfWorker.ts', impo
   type: 'module',
 })
 
-/** Pages beyond this are skipped for image counting (sizing heuristic only). */
-const IMAGE_SCAN_PAGE_LIMIT = 300
-
 export async function openPdf(data: Uint8Array): Promise<PDFDocumentProxy> {
   // pdf.js transfers the buffer to its worker; hand it a copy so callers keep theirs.
   return pdfjs.getDocument({ data: data.slice() }).promise
@@ -27,7 +25,10 @@ export async function openPdf(data: Uint8Array): Promise<PDFDocumentProxy> {
 export async function extractPdfInfo(doc: PDFDocumentProxy): Promise<PdfInfo> {
   let textChars = 0
   let imageCount = 0
+  let scannedPages = 0
   const pageCount = doc.numPages
+  // Images feed the sizing heuristic only; see imageScanStride.
+  const stride = imageScanStride(pageCount)
   // Kept, not just counted: the quality gate checks a card's source excerpt
   // against the page it claims to come from, which is the difference between
   // provenance the model asserts and provenance the app can verify.
@@ -35,8 +36,15 @@ export async function extractPdfInfo(doc: PDFDocumentProxy): Promise<PdfInfo> {
 
   for (let i = 1; i <= pageCount; i++) {
     const page = await doc.getPage(i)
+    const scan = (i - 1) % stride === 0
     try {
-      const text = await page.getTextContent()
+      // Both requests go to the worker; issued together, the worker can parse
+      // the operator list while the text content is still streaming back.
+      const [text, ops] = await Promise.all([
+        page.getTextContent(),
+        scan ? page.getOperatorList() : null,
+      ])
+      if (scan) scannedPages++
       const parts: string[] = []
       for (const item of text.items) {
         if ('str' in item) {
@@ -45,40 +53,62 @@ export async function extractPdfInfo(doc: PDFDocumentProxy): Promise<PdfInfo> {
         }
       }
       pageTexts.push(parts.join(' '))
-      if (i <= IMAGE_SCAN_PAGE_LIMIT) {
-        const ops = await page.getOperatorList()
-        for (const fn of ops.fnArray) {
-          if (fn === pdfjs.OPS.paintImageXObject || fn === pdfjs.OPS.paintInlineImageXObject) {
-            imageCount++
-          }
+      for (const fn of ops?.fnArray ?? []) {
+        if (fn === pdfjs.OPS.paintImageXObject || fn === pdfjs.OPS.paintInlineImageXObject) {
+          imageCount++
         }
       }
     } finally {
       page.cleanup()
     }
   }
+  imageCount = extrapolateImageCount(imageCount, scannedPages, pageCount)
   return { pageCount, textChars, imageCount, pageTexts }
 }
 
-/** Render one page to a data-URL thumbnail (used by coverage grid & card provenance). */
+/** Encoding for page renders: WebP where the webview can encode it, else JPEG. */
+let renderType: 'image/webp' | 'image/jpeg' = 'image/webp'
+
+const encodeCanvas = (canvas: HTMLCanvasElement, type: string): Promise<Blob | null> =>
+  new Promise((resolve) => canvas.toBlob(resolve, type, 0.8))
+
+/**
+ * Render one page to an object-URL thumbnail (used by coverage grid & card
+ * provenance). A blob rather than a data URL: the encoded image is handed to
+ * <img> as-is instead of being base64-inflated into a string that then lives
+ * in store state. The caller owns the URL and revokes it when the image goes.
+ */
 export async function renderPageThumbnail(
   doc: PDFDocumentProxy,
   pageNumber: number,
   targetWidth = 320,
 ): Promise<string> {
   const page = await doc.getPage(pageNumber)
+  const canvas = document.createElement('canvas')
   try {
     const base = page.getViewport({ scale: 1 })
     const scale = targetWidth / base.width
     const viewport = page.getViewport({ scale })
-    const canvas = document.createElement('canvas')
     canvas.width = Math.ceil(viewport.width)
     canvas.height = Math.ceil(viewport.height)
     const ctx = canvas.getContext('2d')
     if (!ctx) throw new Error('canvas 2d context unavailable')
     await page.render({ canvas, canvasContext: ctx, viewport }).promise
-    return canvas.toDataURL('image/webp', 0.8)
+    let blob = await encodeCanvas(canvas, renderType)
+    if (blob && blob.type !== renderType) {
+      // The engine silently fell back to PNG (WebKit has no WebP encoder).
+      // Rendered pages are opaque, so JPEG loses nothing that matters and is
+      // a fraction of the PNG's size; remember that for every later render.
+      renderType = 'image/jpeg'
+      blob = await encodeCanvas(canvas, renderType)
+    }
+    if (!blob) throw new Error('canvas could not be encoded')
+    return URL.createObjectURL(blob)
   } finally {
+    // WebKit caps total canvas memory per page; release the backing store now
+    // rather than whenever the collector gets to it.
+    canvas.width = 0
+    canvas.height = 0
     page.cleanup()
   }
 }
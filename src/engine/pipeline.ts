@@ -18,13 +18,13 @@
 
 import {
   DEPTH_FINISH_ATTEMPTS,
-  GEMINI_PRICING,
   MAX_GENERATION_ROUNDS,
   MAX_REFLECTION_ROUNDS,
   NON_PROGRESS_MAX_ROUNDS,
   REFLECTION_MAX_REMOVAL_RATIO,
   THINKING_BY_PHASE,
 } from './config'
+import { tokenCostUsd } from './cost'
 import {
   buildCoverageCatalog,
   buildDepthGapText,
@@ -470,8 +470,7 @@ export async function runPipeline(opts: PipelineOptions): Promise<PipelineOutcom
   }
 
   // --- Complete ----------------------------------------------------------------
-  const [inPrice, outPrice] = GEMINI_PRICING[opts.model] ?? GEMINI_PRICING.default
-  const costUsd = (usage.inputTokens * inPrice + usage.outputTokens * outPrice) / 1_000_000
+  const costUsd = tokenCostUsd(opts.model, usage.inputTokens, usage.outputTokens)
   emit({ type: 'usage', inputTokens: usage.inputTokens, outputTokens: usage.outputTokens, costUsd })
   emit({ type: 'phase', phase: 'complete' })
   const summary = summarize(
@@ -9,7 +9,7 @@
  * replace the whole record; merging happened in the engine.
  */
 
-import { load } from '@tauri-apps/plugin-store'
+import { load, type Store } from '@tauri-apps/plugin-store'
 import {
   isNewerLedgerVersion,
   ledgerStoreFile,
@@ -21,6 +21,22 @@ import { IS_TAURI } from './platform'
 const STORE_KEY = 'ledger'
 const LS_PREFIX = 'lectern-'
 
+// One open handle per deck file, as settings.ts keeps for settings.json. Every
+// sync reads and then writes the same deck's ledger; loading it afresh each
+// time was an IPC round-trip plus a new store resource that was never closed.
+const stores = new Map<string, Promise<Store>>()
+
+function getStore(file: string): Promise<Store> {
+  let store = stores.get(file)
+  if (!store) {
+    store = load(file, { autoSave: false, defaults: {} })
+    // A failed load is not remembered; the next sync tries again.
+    store.catch(() => stores.delete(file))
+    stores.set(file, store)
+  }
+  return store
+}
+
 export async function readDeckLedger(deckName: string): Promise<DeckLedger | null> {
   const file = ledgerStoreFile(deckName)
   let value: unknown
@@ -29,7 +45,7 @@ export async function readDeckLedger(deckName: string): Promise<DeckLedger | nul
       const raw = localStorage.getItem(LS_PREFIX + file)
       value = raw === null ? null : JSON.parse(raw)
     } else {
-      const store = await load(file, { autoSave: false, defaults: {} })
+      const store = await getStore(file)
       value = await store.get(STORE_KEY)
     }
   } catch {
@@ -47,7 +63,7 @@ export async function writeDeckLedger(ledger: DeckLedger): Promise<void> {
     localStorage.setItem(LS_PREFIX + file, JSON.stringify(ledger))
     return
   }
-  const store = await load(file, { autoSave: false, defaults: {} })
+  const store = await getStore(file)
   await store.set(STORE_KEY, ledger)
   await store.save()
 }
@@ -28,14 +28,23 @@ function toBase64(buffer: ArrayBuffer): string {
   return btoa(binary)
 }
 
+let fontsPromise: Promise<FontAsset[]> | null = null
+
 /** Fetches the app's own font assets (~140 KB total). Called lazily by
- *  ensureLecternModels only when a note type is created or restyled. */
-export async function loadNoteTypeFonts(): Promise<FontAsset[]> {
-  return Promise.all(
+ *  ensureLecternModels only when a note type is created or restyled, or the
+ *  fonts went missing. The encoded result is kept: the bytes never change
+ *  within a build, and a theme switch followed by a sync used to fetch and
+ *  re-encode all four files twice. A failed load is not kept. */
+export function loadNoteTypeFonts(): Promise<FontAsset[]> {
+  fontsPromise ??= Promise.all(
     SOURCES.map(async ({ filename, url }) => {
       const response = await fetch(url)
       if (!response.ok) throw new Error(`Could not load bundled font ${filename}`)
       return { filename, dataBase64: toBase64(await response.arrayBuffer()) }
     }),
-  )
+  ).catch((err: unknown) => {
+    fontsPromise = null
+    throw err
+  })
+  return fontsPromise
 }
@@ -37,6 +37,11 @@ function withMigrations(saved: Partial<Settings>): Settings {
   return { ...merged, model: migrateModel(merged.model) }
 }
 
+// The settings exactly as they sit on disk, serialized. Closing the dialog
+// saves whether or not anything was edited, and with autoSave each set
+// schedules a rewrite of the whole store file; an identical value is skipped.
+let savedJson: string | undefined
+
 export async function loadSettings(): Promise<Settings> {
   if (!IS_TAURI) {
     const raw = localStorage.getItem(LS_SETTINGS)
@@ -44,37 +49,68 @@ export async function loadSettings(): Promise<Settings> {
   }
   const store = await getStore()
   const saved = (await store.get<Partial<Settings>>('settings')) ?? {}
+  savedJson = JSON.stringify(saved)
   return withMigrations(saved)
 }
 
 export async function saveSettings(settings: Settings): Promise<void> {
+  const json = JSON.stringify(settings)
   if (!IS_TAURI) {
-    localStorage.setItem(LS_SETTINGS, JSON.stringify(settings))
+    localStorage.setItem(LS_SETTINGS, json)
     return
   }
+  if (json === savedJson) return
   const store = await getStore()
   await store.set('settings', settings)
+  savedJson = json
 }
 
 // --- API key (never in the JSON store) --------------------------------------
 
+// The key as last read from or written to the keychain. Every generation and
+// follow-up asks for it, and each ask was an IPC round-trip into the OS
+// keychain; the app is the only writer, so the setters keep this current.
+// `undefined` means not read yet.
+let cachedApiKey: string | null | undefined
+// The first read, shared by everyone asking while it runs. On macOS it can sit
+// behind a permission prompt; a setter that finishes meanwhile clears it, so
+// the older answer it eventually brings back is dropped, not cached.
+let pendingRead: Promise<string | null> | null = null
+
 export async function getApiKey(): Promise<string | null> {
-  if (!IS_TAURI) return localStorage.getItem(LS_DEV_KEY)
-  return invoke<string | null>('keychain_get')
+  if (cachedApiKey !== undefined) return cachedApiKey
+  pendingRead ??= IS_TAURI
+    ? invoke<string | null>('keychain_get')
+    : Promise.resolve().then(() => localStorage.getItem(LS_DEV_KEY))
+  const read = pendingRead
+  try {
+    const key = await read
+    if (pendingRead === read) cachedApiKey = key
+    return cachedApiKey === undefined ? key : cachedApiKey
+  } finally {
+    if (pendingRead === read) pendingRead = null
+  }
 }
 
 export async function setApiKey(value: string): Promise<void> {
+  // Re-entering the stored key is not a change; skip the keychain write,
+  // which on some systems is also an OS permission prompt.
+  if (value === cachedApiKey) return
   if (!IS_TAURI) {
     localStorage.setItem(LS_DEV_KEY, value)
-    return
+  } else {
+    await invoke('keychain_set', { value })
   }
-  await invoke('keychain_set', { value })
+  cachedApiKey = value
+  pendingRead = null
 }
 
 export async function deleteApiKey(): Promise<void> {
   if (!IS_TAURI) {
     localStorage.removeItem(LS_DEV_KEY)
-    return
+  } else {
+    await invoke('keychain_delete')
   }
-  await invoke('keychain_delete')
+  cachedApiKey = null
+  pendingRead = null
 }
@@ -21,7 +21,6 @@ import { ensureLecternModels, migrateNotesToLectern } from '../engine/noteTypeSy
 import { loadNoteTypeFonts } from '../lib/noteTypeFonts'
 import { estimateCost, type CostEstimate } from '../engine/cost'
 import { evaluateCard } from '../engine/quality'
-import { extractPdfInfo, openPdf, renderPageThumbnail } from '../engine/pdf'
 import { runFollowUp } from '../engine/followUp'
 import { runPipeline, type FollowUpSeed } from '../engine/pipeline'
 import type {
@@ -37,6 +36,7 @@ import type {
   SyncResult,
 } from '../engine/types'
 import { computeSizingPlan } from '../engine/pacing'
+import { buildCardTags } from '../engine/tags'
 import { confirmDiscard } from '../lib/confirm'
 import { plainCardText } from '../lib/render'
 import { notifyRunFinished } from '../lib/notify'
@@ -45,14 +45,75 @@ import { getApiKey, loadSettings, saveSettings } from '../lib/settings'
 import { tauriFetch } from '../lib/tauriFetch'
 
 const THUMBNAIL_PAGE_LIMIT = 150
+/** Filmstrip thumbnails rendered at once while a PDF loads. */
+const THUMBNAIL_RENDER_CONCURRENCY = 2
 const UNDO_WINDOW_MS = 30_000
 /** Render width for the slide peek panel (2x a ~550px panel). */
 const SLIDE_PEEK_RENDER_WIDTH = 1100
+/** Slide-peek renders kept at once; the least recently peeked go first. */
+const SLIDE_RENDER_CACHE_LIMIT = 24
+
+// pdf.js — a megabyte of parser plus the worker pdf.ts spawns at import — is
+// loaded with the first PDF rather than at launch; the home screen has no use
+// for it until a file is picked. The module system caches the import.
+const loadPdfEngine = () => import('../engine/pdf')
 
 // The open pdf.js document, kept out of the store (not serializable state).
 // Owned by loadPdfFromBytes; used by peekSlide for on-demand full renders.
 let currentDoc: PDFDocumentProxy | null = null
+// Last-pick-wins guard for PDF loads, taken when the file is picked. Reading,
+// opening and scanning a PDF take long enough that a second file can be
+// dropped meanwhile, and a large first file finishing after a small second
+// one would otherwise replace it.
+let pdfLoadSeq = 0
+// The ledger's document hash, per loaded PDF. Every send of a session hashed
+// the whole file again, and lecture PDFs run to tens of megabytes; the bytes
+// are never mutated once loaded, so the digest is computed once per document.
+const pdfDigests = new WeakMap<Uint8Array, Promise<string>>()
+
+function pdfSha256(bytes: Uint8Array): Promise<string> {
+  let digest = pdfDigests.get(bytes)
+  if (!digest) {
+    digest = sha256Hex(bytes)
+    pdfDigests.set(bytes, digest)
+    digest.catch(() => pdfDigests.delete(bytes))
+  }
+  return digest
+}
 const slideRendersInFlight = new Set<number>()
+// Peek recency, oldest first. The renders are ~1100px wide and a long lecture
+// stepped through page by page used to keep every one of them for the session;
+// object keys order integers numerically, so recency is tracked beside them.
+let slideRenderOrder: number[] = []
+
+/** Mark a page as just peeked; returns the pages that fell out of the cache. */
+const touchSlideRender = (page: number): number[] => {
+  slideRenderOrder = [...slideRenderOrder.filter((p) => p !== page), page]
+  return slideRenderOrder.splice(0, Math.max(0, slideRenderOrder.length - SLIDE_RENDER_CACHE_LIMIT))
+}
+
+// One AnkiConnect client per URL for the app's lifetime, rather than a fresh
+// one per action; the URL only changes when the user edits it in settings.
+let ankiClient: AnkiClient | null = null
+const ankiClientFor = (url: string): AnkiClient => {
+  if (ankiClient?.baseUrl !== url) ankiClient = new AnkiClient(url, tauriFetch)
+  return ankiClient
+}
+
+/** How long a finished AnkiConnect probe answers repeat focus refreshes. */
+const ANKI_PROBE_TTL_MS = 2000
+interface AnkiProbe {
+  url: string
+  /** null while the probe is still running. */
+  settledAt: number | null
+  promise: Promise<void>
+}
+let ankiProbe: AnkiProbe | null = null
+
+/** Page renders are object URLs (see renderPageThumbnail); free them with the document. */
+const revokeRenders = (renders: Record<number, string>): void => {
+  for (const url of Object.values(renders)) URL.revokeObjectURL(url)
+}
 
 export interface LogLine {
   level: 'info' | 'warn' | 'error'
@@ -147,6 +208,9 @@ interface LecternActions {
   /** Probe AnkiConnect. Pass a URL to test one the user is still typing in
    *  Settings, rather than the saved one. */
   refreshAnki: (urlOverride?: string) => Promise<void>
+  /** refreshAnki for window focus, which arrives in bursts: a probe of the
+   *  saved URL that finished within ANKI_PROBE_TTL_MS answers instead. */
+  refreshAnkiOnFocus: () => Promise<void>
   openSettings: (open: boolean) => void
   openConcepts: (open: boolean) => void
   applySettings: (settings: Settings) => Promise<void>
@@ -154,7 +218,9 @@ interface LecternActions {
 
   pickPdf: () => Promise<void>
   loadPdfFromPath: (path: string) => Promise<void>
-  loadPdfFromBytes: (fileName: string, bytes: Uint8Array) => Promise<void>
+  /** `pick` is the load's place in line, for callers that had to read the
+   *  file first; the pick itself is when the user chose it, not the read. */
+  loadPdfFromBytes: (fileName: string, bytes: Uint8Array, pick?: number) => Promise<void>
   setDeckName: (name: string) => void
   setExtendDeck: (extend: boolean) => void
   /** Count the notes in the named deck, so the home view can offer to keep
@@ -288,6 +354,41 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
     set({ estimate: estimateCost(pdfInfo, sizing, settings.model), sizing })
   }
 
+  /** Full-size render of a page for the slide peek, cached in slideRenders.
+   *  Settles once the page is cached, already being rendered, or failed —
+   *  the panel falls back to the filmstrip thumbnail meanwhile. */
+  const renderSlide = async (page: number): Promise<void> => {
+    const doc = currentDoc
+    if (!doc) return
+    if (get().slideRenders[page]) {
+      touchSlideRender(page)
+      return
+    }
+    if (slideRendersInFlight.has(page)) return
+    slideRendersInFlight.add(page)
+    try {
+      const { renderPageThumbnail } = await loadPdfEngine()
+      const url = await renderPageThumbnail(doc, page, SLIDE_PEEK_RENDER_WIDTH)
+      if (currentDoc !== doc) {
+        URL.revokeObjectURL(url)
+        return
+      }
+      const evicted = touchSlideRender(page)
+      set((s) => {
+        const slideRenders = { ...s.slideRenders, [page]: url }
+        for (const p of evicted) {
+          URL.revokeObjectURL(slideRenders[p])
+          delete slideRenders[p]
+        }
+        return { slideRenders }
+      })
+    } catch {
+      // unrenderable page; the thumbnail stands in
+    } finally {
+      slideRendersInFlight.delete(page)
+    }
+  }
+
   /** Best-effort install/upgrade of the bundled note types. Failure is not
    *  fatal: model resolution falls back to plain Basic/Cloze when the
    *  Lectern types are absent. */
@@ -374,7 +475,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
         cards,
         slideSetName: slideSetName() || conceptMap.slideSetName,
         pdfPath,
-        pdfSha256: pdfBytes ? await sha256Hex(pdfBytes) : null,
+        pdfSha256: pdfBytes ? await pdfSha256(pdfBytes) : null,
         syncedAt: new Date().toISOString(),
       })
       if (lecture.cards.length === 0) return
@@ -457,21 +558,47 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       void get().refreshAnki()
     },
 
-    refreshAnki: async (urlOverride) => {
+    refreshAnki: (urlOverride) => {
       const { settings, ankiStatus } = get()
-      if (!settings) return
+      if (!settings) return Promise.resolve()
+      const url = urlOverride ?? settings.ankiUrl
+      // A probe of the same URL still running answers for this one too. A
+      // finished one does not: "Check again" right after Anki came up has to
+      // ask again, not repeat the offline answer from moments ago.
+      if (ankiProbe?.url === url && ankiProbe.settledAt === null) return ankiProbe.promise
       // Focus-triggered re-probes shouldn't flicker an already-green dot.
       if (ankiStatus !== 'connected' || urlOverride) set({ ankiStatus: 'checking' })
-      const client = new AnkiClient(urlOverride ?? settings.ankiUrl, tauriFetch)
-      const status = await checkConnection(client)
-      if (status.ok) {
-        const decks = await client.deckNames().catch(() => [] as string[])
-        set({ ankiStatus: 'connected', ankiDecks: decks })
-        // Anki just became reachable — the deck in the field can be looked up.
-        void get().probeExistingDeck()
-      } else {
-        set({ ankiStatus: 'offline', ankiDecks: [], existingDeckCount: null })
+      const probe: AnkiProbe = { url, settledAt: null, promise: Promise.resolve() }
+      probe.promise = (async () => {
+        const client = ankiClientFor(url)
+        const status = await checkConnection(client)
+        if (status.ok) {
+          const decks = await client.deckNames().catch(() => [] as string[])
+          set({ ankiStatus: 'connected', ankiDecks: decks })
+          // Anki just became reachable — the deck in the field can be looked up.
+          void get().probeExistingDeck()
+        } else {
+          set({ ankiStatus: 'offline', ankiDecks: [], existingDeckCount: null })
+        }
+      })().finally(() => {
+        probe.settledAt = Date.now()
+      })
+      ankiProbe = probe
+      return probe.promise
+    },
+
+    refreshAnkiOnFocus: () => {
+      // Focus events arrive in bursts (every alt-tab, every dialog closing),
+      // and each used to cost a version probe plus a deck listing.
+      const url = get().settings?.ankiUrl
+      if (
+        ankiProbe?.url === url &&
+        ankiProbe.settledAt !== null &&
+        Date.now() - ankiProbe.settledAt < ANKI_PROBE_TTL_MS
+      ) {
+        return ankiProbe.promise
       }
+      return get().refreshAnki()
     },
 
     openSettings: (open) => set({ settingsOpen: open }),
@@ -490,7 +617,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
         (before?.useLecternNoteTypes !== settings.useLecternNoteTypes ||
           before?.noteTypeTheme !== settings.noteTypeTheme)
       if (designChanged) {
-        void ensureNoteTypes(new AnkiClient(settings.ankiUrl, tauriFetch), settings, true)
+        void ensureNoteTypes(ankiClientFor(settings.ankiUrl), settings, true)
       }
     },
 
@@ -505,7 +632,9 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
         input.onchange = async () => {
           const file = input.files?.[0]
           if (file) {
-            await get().loadPdfFromBytes(file.name, new Uint8Array(await file.arrayBuffer()))
+            const pick = ++pdfLoadSeq
+            const bytes = new Uint8Array(await file.arrayBuffer())
+            await get().loadPdfFromBytes(file.name, bytes, pick)
           }
         }
         input.click()
@@ -524,25 +653,37 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
         return
       }
       const fileName = path.split('/').pop() ?? 'document.pdf'
+      const pick = ++pdfLoadSeq
       try {
         const bytes = await readFile(path)
-        await get().loadPdfFromBytes(fileName, bytes)
+        await get().loadPdfFromBytes(fileName, bytes, pick)
         // loadPdfFromBytes only knows bytes; the path is this caller's to
         // record — but only if that load actually took (it toasts and leaves
         // the previous document in place when the file is unreadable).
         if (get().fileName === fileName && get().pdfBytes === bytes) set({ pdfPath: path })
       } catch (e) {
+        if (pick !== pdfLoadSeq) return // superseded while reading
         get().toast('error', `Could not read ${fileName}: ${(e as Error).message}`)
       }
     },
 
-    loadPdfFromBytes: async (fileName, bytes) => {
+    loadPdfFromBytes: async (fileName, bytes, pick) => {
+      const seq = pick ?? ++pdfLoadSeq
+      if (seq !== pdfLoadSeq) return // a later pick arrived while this file was read
       try {
+        const { extractPdfInfo, openPdf, renderPageThumbnail } = await loadPdfEngine()
         const doc = await openPdf(bytes)
         const pdfInfo = await extractPdfInfo(doc)
+        if (seq !== pdfLoadSeq) {
+          void doc.loadingTask.destroy().catch(() => {}) // a later pick won
+          return
+        }
         void currentDoc?.loadingTask.destroy().catch(() => {})
         currentDoc = doc
         slideRendersInFlight.clear()
+        slideRenderOrder = []
+        revokeRenders(get().pageThumbs)
+        revokeRenders(get().slideRenders)
         // A deck name the user typed survives swapping the PDF; one Lectern
         // suggested from the previous file name follows the new file, so
         // "Replace" doesn't leave last lecture's deck on this lecture.
@@ -566,17 +707,30 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
         void get().probeExistingDeck()
 
         // Render thumbnails progressively; the filmstrip fills in as they land.
+        // A small fixed pool of renders in flight: pdf.js parses the next page
+        // in its worker while the main thread paints this one, and the bound
+        // keeps a long deck from queueing a canvas per page at once.
         const pages = Math.min(pdfInfo.pageCount, THUMBNAIL_PAGE_LIMIT)
-        for (let p = 1; p <= pages; p++) {
-          if (get().fileName !== fileName) break // replaced meanwhile
-          try {
-            const url = await renderPageThumbnail(doc, p, 240)
-            set((s) => ({ pageThumbs: { ...s.pageThumbs, [p]: url } }))
-          } catch {
-            // skip unrenderable page
+        let nextPage = 1
+        const renderQueued = async (): Promise<void> => {
+          while (nextPage <= pages) {
+            if (get().fileName !== fileName) return // replaced meanwhile
+            const p = nextPage++
+            try {
+              const url = await renderPageThumbnail(doc, p, 240)
+              if (currentDoc !== doc) {
+                URL.revokeObjectURL(url) // landed after a newer PDF took over
+                return
+              }
+              set((s) => ({ pageThumbs: { ...s.pageThumbs, [p]: url } }))
+            } catch {
+              // skip unrenderable page
+            }
           }
         }
+        await Promise.all(Array.from({ length: THUMBNAIL_RENDER_CONCURRENCY }, renderQueued))
       } catch (e) {
+        if (seq !== pdfLoadSeq) return // nobody is waiting on this file any more
         get().toast('error', `Could not read ${fileName}: ${(e as Error).message}`)
       }
     },
@@ -600,7 +754,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       }
       const seq = ++deckProbeSeq
       try {
-        const client = new AnkiClient(settings.ankiUrl, tauriFetch)
+        const client = ankiClientFor(settings.ankiUrl)
         const count = await countDeckNotes(client, deckName)
         if (seq === deckProbeSeq) set({ existingDeckCount: count })
       } catch {
@@ -672,7 +826,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       let existingCards: Card[] = []
       if (extendDeck && (existingDeckCount ?? 0) > 0) {
         try {
-          const client = new AnkiClient(settings.ankiUrl, tauriFetch)
+          const client = ankiClientFor(settings.ankiUrl)
           const imported = await fetchDeckCards(client, deckName)
           existingCards = imported.cards
           set({ cards: existingCards })
@@ -893,13 +1047,13 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
 
     peekSlide: (page) => {
       set({ slidePeek: page })
-      if (page === null || !currentDoc) return
-      if (get().slideRenders[page] || slideRendersInFlight.has(page)) return
-      slideRendersInFlight.add(page)
-      renderPageThumbnail(currentDoc, page, SLIDE_PEEK_RENDER_WIDTH)
-        .then((url) => set((s) => ({ slideRenders: { ...s.slideRenders, [page]: url } })))
-        .catch(() => {}) // panel falls back to the filmstrip thumbnail
-        .finally(() => slideRendersInFlight.delete(page))
+      if (page === null) return
+      // Read ahead one page once this one is up: the panel is paged through
+      // with the arrow keys, so the next press usually finds its render done.
+      void renderSlide(page).then(() => {
+        const pageCount = get().pdfInfo?.pageCount ?? 0
+        if (get().slidePeek === page && page < pageCount) void renderSlide(page + 1)
+      })
     },
 
     // Runs by itself whenever the send bar's card set changes, so the bar can
@@ -913,7 +1067,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       const seq = ++syncPreviewSeq
       set({ syncPreview: null })
       try {
-        const client = new AnkiClient(settings.ankiUrl, tauriFetch)
+        const client = ankiClientFor(settings.ankiUrl)
         const preview = await previewSync(
           client,
           syncable,
@@ -934,7 +1088,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       if (!settings || syncable.length === 0) return
       set({ syncState: 'syncing', syncProgress: { done: 0, total: syncable.length } })
       try {
-        const client = new AnkiClient(settings.ankiUrl, tauriFetch)
+        const client = ankiClientFor(settings.ankiUrl)
         await ensureNoteTypes(client, settings)
         const result = await syncCards(
           client,
@@ -991,7 +1145,7 @@ export const useLectern = create<LecternState & LecternActions>()((set, get) =>
       if (!settings || migratingCards) return
       set({ migratingCards: true })
       try {
-        const client = new AnkiClient(settings.ankiUrl, tauriFetch)
+        const client = ankiClientFor(settings.ankiUrl)
         await ensureNoteTypes(client, settings)
         const result = await migrateNotesToLectern(client, settings.defaultTag)
         if (result.migrated === 0 && result.failures.length === 0) {
@@ -1029,9 +1183,7 @@ if (import.meta.env.DEV) {
   ;(window as unknown as Record<string, unknown>).__lectern = useLectern
 }
 
-// Tag construction shared by preview + sync.
-import { buildCardTags } from '../engine/tags'
-
+/** Tag construction shared by preview + sync. */
 function cardTags(
   card: Card,
   settings: Settings,